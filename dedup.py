@@ -0,0 +1,244 @@
+import random
+import re
+import unicodedata
+import zlib
+
+
+# Leading amount of an ingredient line, e.g. "22.5", "1/2", "2-3", "a", "few"
+QUANTITY_PATTERN = r"(?:an?|few|[0-9][0-9./]*(?:\s*(?:-|to)\s*[0-9.]+)?)"
+
+# Unit following the amount, e.g. "ml", "bar spoons", "dashes"
+UNIT_PATTERN = (
+    r"(?:ml|cl|oz|bar spoons?|teaspoons?|tsp|tablespoons?|tbsp|dash(?:es)?|"
+    r"drops?|splash|pinch(?:es)?|pcs?)"
+)
+
+
+def normalize_name(name):
+    """Lowercase, strip accents and punctuation, and collapse whitespace"""
+    if not name:
+        return ""
+
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.lower().replace("’", "'").replace("'", "")
+    text = re.sub(r"[^a-z0-9]+", " ", text)
+    return text.strip()
+
+
+def normalize_ingredient_name(name):
+    """Normalized key for an ingredient name, "Fresh lime juice" -> "lime juice" """
+    name = re.sub(r"\(.*?\)|\*", "", name)
+    key = normalize_name(name)
+    key = re.sub(r"^(?:of|with)\s+", "", key)
+    key = re.sub(r"^(?:freshly squeezed|fresh squeezed|fresh|freshly)\s+", "", key)
+    return key
+
+
+def split_ingredient(line):
+    """Split an ingredient line into (quantity, unit, normalized name)
+
+    Quantity and unit are the lowercased text as written, or "" if missing.
+    "Top up with Soda Water" and "Fill up with Cola" have the quantity "top".
+    """
+    text = re.sub(r"\s+", " ", line).strip()
+
+    match = re.match(r"^(?:top|fill)(?: up)?(?: with)?\s+(.*)$", text, re.IGNORECASE)
+    if match:
+        return "top", "", normalize_ingredient_name(match.group(1))
+
+    # "30ml Gin" is missing the space before its unit
+    text = re.sub(r"^([0-9.]+)(?=[a-z])", r"\1 ", text, flags=re.IGNORECASE)
+    match = re.match(
+        rf"^(?:({QUANTITY_PATTERN})\s+)?(?:({UNIT_PATTERN})\b\.?\s*(?:of\s+)?)?(.*)$",
+        text,
+        re.IGNORECASE,
+    )
+    quantity, unit, name = match.groups()
+    return (
+        (quantity or "").lower(),
+        (unit or "").lower(),
+        normalize_ingredient_name(name),
+    )
+
+
+class RecipeDeduplicator:
+    """Flag and merge near-duplicate cocktails using a MinHash LSH index
+
+    Names are normalized and broken into character n-grams, hashed into a
+    MinHash signature and bucketed by band, so looking up candidates only
+    touches recipes that share a bucket instead of scanning the whole corpus.
+    Candidates are then confirmed with the exact name similarity and the
+    overlap of their ingredient sets, so recipes without ingredients are only
+    merged on an identical URL or normalized name.
+    """
+
+    # Smallest prime above 2**32, so the modulus exceeds every crc32 value
+    PRIME = 4294967311
+
+    def __init__(
+        self,
+        num_perm=64,
+        bands=16,
+        ngram_size=3,
+        name_threshold=0.8,
+        ingredient_threshold=0.5,
+        seed=1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram_size = ngram_size
+        self.name_threshold = name_threshold
+        self.ingredient_threshold = ingredient_threshold
+
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, self.PRIME), rng.randrange(0, self.PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self.entries = []  # [(recipe, normalized name, shingles, ingredients)]
+        self.buckets = {}  # (band, band signature) -> [entry index]
+        self.urls = {}  # url -> entry index
+        self.names = {}  # normalized name -> entry index
+
+    def name_shingles(self, name):
+        """Character n-grams of the normalized name, padded at word edges"""
+        text = normalize_name(name)
+        if not text:
+            return set()
+
+        padded = f" {text} "
+        if len(padded) <= self.ngram_size:
+            return {padded}
+        return {
+            padded[i : i + self.ngram_size]
+            for i in range(len(padded) - self.ngram_size + 1)
+        }
+
+    def ingredient_set(self, ingredients):
+        """Normalized ingredient names with quantities and units removed"""
+        tokens = set()
+        for line in ingredients or []:
+            name = split_ingredient(line)[2]
+            if name:
+                tokens.add(name)
+        return tokens
+
+    def signature(self, shingles):
+        """MinHash signature of a set of shingles"""
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+        if not hashes:
+            return [self.PRIME] * self.num_perm
+        return [
+            min((a * h + b) % self.PRIME for h in hashes)
+            for a, b in self.permutations
+        ]
+
+    def band_keys(self, signature):
+        """Bucket keys for each band of a signature"""
+        return [
+            (band, tuple(signature[band * self.rows : (band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def jaccard(a, b):
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+    @staticmethod
+    def trailing_number(name):
+        """Trailing number of a normalized name, e.g. "corpse reviver 2" -> "2" """
+        match = re.search(r"(?:^|\s)([0-9]+)$", name)
+        return match.group(1) if match else None
+
+    def find_duplicate(self, recipe, fuzzy=True):
+        """Return the indexed recipe that ``recipe`` duplicates, if any
+
+        Without ``fuzzy`` only an identical URL or normalized name matches.
+        """
+        url = recipe.get("url")
+        if url and url in self.urls:
+            return self.entries[self.urls[url]][0]
+
+        name = normalize_name(recipe.get("name"))
+        if not name:
+            return None
+        if name in self.names:
+            return self.entries[self.names[name]][0]
+        if not fuzzy:
+            return None
+
+        # Near-duplicates are only confirmed against the ingredient sets
+        ingredients = self.ingredient_set(recipe.get("ingredients"))
+        if not ingredients:
+            return None
+
+        shingles = self.name_shingles(name)
+        number = self.trailing_number(name)
+        candidates = set()
+        for key in self.band_keys(self.signature(shingles)):
+            candidates.update(self.buckets.get(key, ()))
+
+        best, best_score = None, 0.0
+        for index in candidates:
+            existing, existing_name, existing_shingles, existing_ingredients = (
+                self.entries[index]
+            )
+            # "Corpse Reviver #2" and "Corpse Reviver" are different drinks
+            if self.trailing_number(existing_name) != number:
+                continue
+            score = self.jaccard(shingles, existing_shingles)
+            if score < self.name_threshold:
+                continue
+            if (
+                self.jaccard(ingredients, existing_ingredients)
+                < self.ingredient_threshold
+            ):
+                continue
+            if score > best_score:
+                best, best_score = existing, score
+        return best
+
+    def add(self, recipe, fuzzy=True):
+        """Index a recipe, merging it into a duplicate if one exists
+
+        Returns the recipe it was merged into, or None if it was new.
+        """
+        duplicate = self.find_duplicate(recipe, fuzzy=fuzzy)
+        if duplicate is not None:
+            self.merge(duplicate, recipe)
+            return duplicate
+
+        url = recipe.get("url")
+        name = normalize_name(recipe.get("name"))
+        shingles = self.name_shingles(name)
+        ingredients = self.ingredient_set(recipe.get("ingredients"))
+
+        index = len(self.entries)
+        self.entries.append((recipe, name, shingles, ingredients))
+        if url:
+            self.urls[url] = index
+        if name:
+            self.names[name] = index
+        if shingles:
+            for key in self.band_keys(self.signature(shingles)):
+                self.buckets.setdefault(key, []).append(index)
+        return None
+
+    def merge(self, existing, duplicate):
+        """Fill fields missing from the existing recipe using the duplicate"""
+        for key, value in duplicate.items():
+            if value and not existing.get(key):
+                existing[key] = value
+        return existing
+
+    def recipes(self):
+        """All unique recipes, in the order they were first added"""
+        return [entry[0] for entry in self.entries]
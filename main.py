@@ -10,6 +10,8 @@ from pathlib import Path
 from PIL import Image
 import yt_dlp
 
+from dedup import RecipeDeduplicator
+
 
 class IBACocktailScraper:
     def __init__(self):
@@ -27,6 +29,9 @@ class IBACocktailScraper:
         cocktail_links = []
         page = 1
 
+        # Links have no ingredients yet, so only exact repeats are merged here
+        deduplicator = RecipeDeduplicator()
+
         while True:
             print(f"Scraping page {page}...")
             if page == 1:
@@ -67,17 +72,18 @@ class IBACocktailScraper:
                                 # Extract category from surrounding elements
                                 category = self.extract_category(link)
 
-                                if name and full_url not in [
-                                    c["url"] for c in cocktail_links
-                                ]:
-                                    cocktail_links.append(
-                                        {
-                                            "name": name,
-                                            "url": full_url,
-                                            "category": category,
-                                            "views": views,
-                                        }
-                                    )
+                                cocktail_info = {
+                                    "name": name,
+                                    "url": full_url,
+                                    "category": category,
+                                    "views": views,
+                                }
+                                if (
+                                    name
+                                    and deduplicator.add(cocktail_info, fuzzy=False)
+                                    is None
+                                ):
+                                    cocktail_links.append(cocktail_info)
                                     page_links.append(name)
                         break  # If we found links with one selector, use those
 
@@ -101,19 +107,23 @@ class IBACocktailScraper:
                         ):
 
                             full_url = urljoin(self.base_url, href)
-                            if full_url not in [c["url"] for c in cocktail_links]:
+                            if full_url not in deduplicator.urls:
                                 name, views = self.clean_cocktail_name(raw_text)
                                 category = self.extract_category(link)
 
-                                if name:  # Only add if we got a clean name
-                                    cocktail_links.append(
-                                        {
-                                            "name": name,
-                                            "url": full_url,
-                                            "category": category,
-                                            "views": views,
-                                        }
-                                    )
+                                cocktail_info = {
+                                    "name": name,
+                                    "url": full_url,
+                                    "category": category,
+                                    "views": views,
+                                }
+                                # Only add if we got a clean, unseen name
+                                if (
+                                    name
+                                    and deduplicator.add(cocktail_info, fuzzy=False)
+                                    is None
+                                ):
+                                    cocktail_links.append(cocktail_info)
                                     page_links.append(name)
 
                 if not page_links:  # No new cocktails found
@@ -604,6 +614,9 @@ class IBACocktailScraper:
         recipes = []
         successful = 0
 
+        # Merge near-duplicate recipes once their ingredients are known
+        deduplicator = RecipeDeduplicator()
+
         for i, cocktail_info in enumerate(cocktail_links[:max_cocktails]):
             print(
                 f"Scraping {i+1}/{len(cocktail_links[:max_cocktails])}: {cocktail_info['name']}"
@@ -615,7 +628,14 @@ class IBACocktailScraper:
                 recipe["category"] = cocktail_info["category"]
                 recipe["views"] = cocktail_info.get("views")
 
-                recipes.append(recipe)
+                duplicate = deduplicator.add(recipe)
+                if duplicate is None:
+                    recipes.append(recipe)
+                else:
+                    print(
+                        f"  Merged near-duplicate '{recipe['name']}' "
+                        f"into '{duplicate['name']}'"
+                    )
                 successful += 1
                 print(f"  Successfully scraped {cocktail_info['name']}")
             else:
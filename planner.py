@@ -0,0 +1,362 @@
+import json
+import os
+import re
+from functools import cached_property
+
+import numpy as np
+
+from dedup import normalize_ingredient_name, split_ingredient
+
+
+# Conversion factors to ml for volume units
+VOLUME_UNITS = {
+    "ml": 1.0,
+    "cl": 10.0,
+    "oz": 30.0,
+    "bar spoon": 5.0,
+    "teaspoon": 5.0,
+    "tsp": 5.0,
+    "tablespoon": 15.0,
+    "tbsp": 15.0,
+    "dash": 0.9,
+    "drop": 0.05,
+    "splash": 15.0,
+}
+
+# Volume assumed for "Top up with ..." / "Fill up with ..." lines
+TOP_UP_ML = 60.0
+
+# Words marking non-alcoholic ingredients that are measured by volume
+LIQUID_WORDS = {"juice", "syrup", "water", "cream", "soda", "cola", "puree"}
+
+# Volume in ml of liquids that recipes count rather than measure
+LIQUID_COUNTS = {"espresso": 30.0}
+
+# Words marking solids, which are kept in teaspoons rather than ml
+SOLID_WORDS = {"sugar", "salt", "pepper"}
+
+# Typical ABV (%) by ingredient keyword, most specific first. Keywords match
+# whole words, and non-alcoholic names that contain a spirit come first.
+ABV_KEYWORDS = [
+    ("ginger beer", 0.0),
+    ("ginger ale", 0.0),
+    ("cordial", 0.0),
+    ("green chartreuse", 55.0),
+    ("yellow chartreuse", 40.0),
+    ("absinthe", 60.0),
+    ("pernod", 40.0),
+    ("overproof", 63.0),
+    ("bitters", 44.0),
+    ("angostura", 44.0),
+    ("benedictine", 40.0),
+    ("sweet vermouth", 16.0),
+    ("dry vermouth", 18.0),
+    ("vermouth", 16.0),
+    ("cherry brandy", 25.0),
+    ("apricot brandy", 24.0),
+    ("peach brandy", 24.0),
+    ("creme de", 20.0),
+    ("liqueur", 25.0),
+    ("schnapps", 20.0),
+    ("campari", 25.0),
+    ("aperol", 11.0),
+    ("cointreau", 40.0),
+    ("triple sec", 40.0),
+    ("grand marnier", 40.0),
+    ("curacao", 30.0),
+    ("maraschino", 32.0),
+    ("amaretto", 28.0),
+    ("frangelico", 20.0),
+    ("kahlua", 20.0),
+    ("drambuie", 40.0),
+    ("fernet", 39.0),
+    ("amaro", 35.0),
+    ("cynar", 16.5),
+    ("falernum", 11.0),
+    ("lillet", 17.0),
+    ("port", 20.0),
+    ("sherry", 17.0),
+    ("amontillado", 17.0),
+    ("palo cortado", 17.0),
+    ("champagne", 12.0),
+    ("prosecco", 11.0),
+    ("sparkling wine", 12.0),
+    ("wine", 13.0),
+    ("sangue morlacco", 30.0),
+    ("rum", 40.0),
+    ("rhum", 40.0),
+    ("ron", 40.0),
+    ("cachaca", 40.0),
+    ("aguardiente", 40.0),
+    ("gin", 40.0),
+    ("vodka", 40.0),
+    ("whiskey", 40.0),
+    ("whisky", 40.0),
+    ("scotch", 40.0),
+    ("lagavulin", 43.0),
+    ("bourbon", 40.0),
+    ("tequila", 40.0),
+    ("mezcal", 40.0),
+    ("cognac", 40.0),
+    ("calvados", 40.0),
+    ("brandy", 40.0),
+    ("pisco", 40.0),
+    ("grappa", 40.0),
+]
+
+DEFAULT_DILUTION = 0.10  # built over ice
+
+# Fraction of melted ice added by the preparation method, as whole-word
+# patterns checked in order. A gentle stir in the serving glass is a build.
+DILUTION = [
+    (r"blend|blended|blender", 0.30),
+    (r"shake|shaken|shaker", 0.25),
+    (r"build|built", DEFAULT_DILUTION),
+    (r"mixing glass", 0.20),
+    (r"stir gently|gently stir|light stir|stir briefly|do not stir", DEFAULT_DILUTION),
+    (r"stir|stirred|stirring", 0.20),
+]
+
+
+def parse_amount(text):
+    """Parse "2", "22.5", "1/2", "2-3", "3 to 4" or "6/8" into a number"""
+    text = text.strip()
+    match = re.fullmatch(r"([0-9.]+)\s*(?:-|to)\s*([0-9.]+)", text)
+    if match:
+        return (float(match.group(1)) + float(match.group(2))) / 2
+    match = re.fullmatch(r"([0-9]+)/([0-9]+)", text)
+    if match:
+        numerator, denominator = int(match.group(1)), int(match.group(2))
+        # "1/2" is a fraction, "6/8 pcs Mint Leaves" is a range
+        if numerator == 1 or denominator <= 4:
+            return numerator / denominator
+        return (numerator + denominator) / 2
+    return float(text)
+
+
+def parse_ingredient(line):
+    """Split an ingredient line into (amount, unit, name)
+
+    Volumes are converted to ml and spoonfuls of solids such as sugar to
+    "tsp". Counted items use "pcs" and anything without a usable quantity
+    (e.g. "Tabasco, Celery Salt, Pepper") uses "to taste".
+    """
+    quantity, unit, name = split_ingredient(line)
+    if quantity == "top":
+        return TOP_UP_ML, "ml", name
+
+    if not quantity:
+        amount = 1.0
+    elif quantity in ("a", "an"):
+        amount = 1.0
+    elif quantity == "few":
+        amount = 3.0
+    else:
+        try:
+            amount = parse_amount(quantity)
+        except ValueError:
+            return 1.0, "to taste", normalize_ingredient_name(line)
+
+    if not unit:
+        # "1 strong Espresso" is a shot rather than a piece
+        for word, volume in LIQUID_COUNTS.items():
+            if word in name.split():
+                return amount * volume, "ml", name
+        # "30 Fresh Lime Juice" is missing its unit, "Soda Water" is a top up
+        if is_liquid(name):
+            return (amount if quantity else TOP_UP_ML), "ml", name
+        if not quantity:
+            return 1.0, "to taste", name
+        return amount, "pcs", name
+
+    unit = re.sub(r"(?:es|s)$", "", unit)
+    if unit in VOLUME_UNITS:
+        if is_solid(name):
+            return amount * VOLUME_UNITS[unit] / VOLUME_UNITS["tsp"], "tsp", name
+        return amount * VOLUME_UNITS[unit], "ml", name
+    if unit == "pinch":
+        return amount, "pinch", name
+    return amount, "pcs", name
+
+
+def is_liquid(name):
+    """Whether a normalized ingredient name is measured by volume"""
+    if is_solid(name):
+        return False
+    return bool(set(name.split()) & LIQUID_WORDS) or ingredient_abv(name) > 0
+
+
+def is_solid(name):
+    """Whether a normalized ingredient name is a solid such as sugar"""
+    words = set(name.split())
+    return bool(words & SOLID_WORDS) and not words & LIQUID_WORDS
+
+
+def ingredient_abv(name):
+    """Typical ABV (%) for a normalized ingredient name, 0 if non-alcoholic"""
+    for keyword, abv in ABV_KEYWORDS:
+        if re.search(rf"\b{re.escape(keyword)}\b", name):
+            return abv
+    return 0.0
+
+
+def method_dilution(method):
+    """Dilution fraction implied by the preparation method"""
+    text = re.sub(r"\s+", " ", (method or "").lower())
+    for pattern, dilution in DILUTION:
+        if re.search(rf"\b(?:{pattern})\b", text):
+            return dilution
+    return DEFAULT_DILUTION
+
+
+class RecipeBatch:
+    """Recipes as a (recipes x ingredients) quantity matrix for event planning
+
+    Each column is a normalized ingredient in a single unit ("ml", "tsp",
+    "pcs", "pinch" or "to taste"). The matrix and per-column metadata are
+    built once and cached, so scaling and aggregation are plain NumPy
+    operations.
+    """
+
+    def __init__(self, recipes):
+        self.recipes = list(recipes)
+        self.names = [recipe["name"] for recipe in self.recipes]
+        self._rows = {}
+        for i, name in enumerate(self.names):
+            if name in self._rows:
+                raise ValueError(f"Duplicate recipe name: {name}")
+            self._rows[name] = i
+
+    @cached_property
+    def _parsed(self):
+        columns = {}  # (ingredient, unit) -> column index
+        entries = []  # (row, column, amount)
+        for row, recipe in enumerate(self.recipes):
+            for line in recipe.get("ingredients", []):
+                amount, unit, name = parse_ingredient(line)
+                if not name:
+                    continue
+                column = columns.setdefault((name, unit), len(columns))
+                entries.append((row, column, amount))
+
+        quantities = np.zeros((len(self.recipes), len(columns)))
+        if entries:
+            rows, cols, amounts = (np.array(v) for v in zip(*entries))
+            np.add.at(quantities, (rows, cols), amounts)
+        # Shared by every caller of load_recipe_batch, so keep it read-only
+        quantities.setflags(write=False)
+        return quantities, list(columns)
+
+    @property
+    def quantities(self):
+        """Per-drink quantity matrix, shape (recipes, ingredients)"""
+        return self._parsed[0]
+
+    @property
+    def ingredients(self):
+        """(name, unit) for each column of the quantity matrix"""
+        return self._parsed[1]
+
+    @cached_property
+    def units(self):
+        """Unit of each ingredient column"""
+        return np.array([unit for _, unit in self.ingredients])
+
+    @cached_property
+    def abv(self):
+        """Typical ABV (fraction) of each ingredient column"""
+        return np.array(
+            [
+                ingredient_abv(name) / 100 if unit == "ml" else 0.0
+                for name, unit in self.ingredients
+            ]
+        )
+
+    @cached_property
+    def dilution(self):
+        """Dilution fraction of each recipe based on its method"""
+        return np.array(
+            [method_dilution(recipe.get("method")) for recipe in self.recipes]
+        )
+
+    def servings_vector(self, servings):
+        """Per-recipe servings from a number, array or {name: servings} dict"""
+        if isinstance(servings, dict):
+            vector = np.zeros(len(self.recipes))
+            for name, count in servings.items():
+                if name not in self._rows:
+                    raise KeyError(f"Unknown recipe: {name}")
+                vector[self._rows[name]] = count
+            return vector
+        return np.broadcast_to(np.asarray(servings, dtype=float), len(self.recipes))
+
+    def scale(self, servings):
+        """Quantity matrix scaled to the given servings per recipe"""
+        return self.quantities * self.servings_vector(servings)[:, None]
+
+    def shopping_list(self, servings):
+        """Total amount of each ingredient needed for the given servings
+
+        Returns {(name, unit): amount}, skipping ingredients that are not used
+        and "to taste" ingredients, which have no amount to add up.
+        """
+        totals = self.servings_vector(servings) @ self.quantities
+        totals[self.units == "to taste"] = 0
+        return {
+            self.ingredients[i]: float(totals[i]) for i in np.flatnonzero(totals)
+        }
+
+    def volumes(self):
+        """Liquid volume of each drink in ml before dilution"""
+        return self.quantities[:, self.units == "ml"].sum(axis=1)
+
+    def alcohol(self):
+        """Pure alcohol in ml per drink"""
+        return self.quantities @ self.abv
+
+    def final_volumes(self):
+        """Volume of each drink in ml after dilution from ice"""
+        return self.volumes() * (1 + self.dilution)
+
+    def abv_estimates(self):
+        """Estimated ABV (%) of each finished drink"""
+        volumes = self.final_volumes()
+        alcohol = self.alcohol()
+        return np.divide(
+            alcohol * 100, volumes, out=np.zeros_like(volumes), where=volumes > 0
+        )
+
+    def metrics(self):
+        """Per-drink volume, dilution and alcohol estimates"""
+        volumes = self.volumes()
+        final_volumes = self.final_volumes()
+        alcohol = self.alcohol()
+        abv = self.abv_estimates()
+        return [
+            {
+                "name": name,
+                "volume_ml": float(volumes[i]),
+                "dilution": float(self.dilution[i]),
+                "final_volume_ml": float(final_volumes[i]),
+                "alcohol_ml": float(alcohol[i]),
+                "abv": float(abv[i]),
+            }
+            for i, name in enumerate(self.names)
+        ]
+
+
+_batch_cache = {}
+
+
+def load_recipe_batch(filename="iba_cocktail_recipes.json"):
+    """Load a RecipeBatch from scraped JSON, reusing it until the file changes"""
+    key = os.path.abspath(filename)
+    mtime = os.path.getmtime(key)
+    cached = _batch_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(key, encoding="utf-8") as f:
+        batch = RecipeBatch(json.load(f))
+    _batch_cache[key] = (mtime, batch)
+    return batch
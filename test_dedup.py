@@ -0,0 +1,60 @@
+from dedup import RecipeDeduplicator, split_ingredient
+
+SIDECAR = ["30 ml White Rum", "30 ml Cognac", "30 ml Triple Sec", "20 ml Lemon Juice"]
+REVIVER = ["30 ml Gin", "30 ml Cointreau", "30 ml Lillet Blanc", "30 ml Lemon Juice"]
+
+
+def recipe(name, url, ingredients=None):
+    return {"name": name, "url": url, "ingredients": ingredients or []}
+
+
+def test_case_and_suffix_variants_merge():
+    index = RecipeDeduplicator()
+    original = recipe("Between the Sheets", "a", SIDECAR)
+    assert index.add(original) is None
+    assert index.add(recipe("Between The Sheets", "b", SIDECAR)) is original
+    assert index.add(recipe("Between The Sheet", "c", SIDECAR[:3])) is original
+    assert index.recipes() == [original]
+
+
+def test_trailing_numbers_do_not_merge():
+    index = RecipeDeduplicator()
+    assert index.add(recipe("Corpse Reviver", "a", REVIVER)) is None
+    assert index.add(recipe("Corpse Reviver #2", "b", REVIVER)) is None
+    assert index.add(recipe("Rum Punch No 2", "c", SIDECAR)) is None
+    assert index.add(recipe("Rum Punch No 3", "d", SIDECAR)) is None
+    assert len(index.recipes()) == 4
+
+
+def test_no_fuzzy_merge_without_ingredients():
+    index = RecipeDeduplicator()
+    assert index.add(recipe("Between the Sheets", "a")) is None
+    assert index.add(recipe("Between The Sheet", "b", SIDECAR)) is None
+    assert index.add(recipe("Between Sheets", "c")) is None
+
+
+def test_exact_matches_only_without_fuzzy():
+    index = RecipeDeduplicator()
+    original = recipe("Between the Sheets", "a", SIDECAR)
+    index.add(original, fuzzy=False)
+    assert index.add(recipe("Between The Sheet", "b", SIDECAR), fuzzy=False) is None
+    assert index.add(recipe("Other", "a"), fuzzy=False) is original
+    assert index.add(recipe("BETWEEN THE SHEETS!", "d"), fuzzy=False) is original
+
+
+def test_merge_fills_missing_fields():
+    index = RecipeDeduplicator()
+    original = {"name": "Negroni", "url": "a", "garnish": "", "video": None}
+    index.add(original)
+    index.add({"name": "Negroni", "url": "b", "garnish": "Orange", "video": "v"})
+    assert original["garnish"] == "Orange"
+    assert original["video"] == "v"
+    assert original["url"] == "a"
+
+
+def test_split_ingredient_keeps_unit_letters_in_names():
+    assert split_ingredient("1 cloudy apple juice") == ("1", "", "cloudy apple juice")
+    assert split_ingredient("2 clementine") == ("2", "", "clementine")
+    assert split_ingredient("Top up with Soda Water") == ("top", "", "soda water")
+    assert split_ingredient("Top with soda water")[2] == "soda water"
+    assert split_ingredient("30ml Egg white") == ("30", "ml", "egg white")
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from planner import (
+    RecipeBatch,
+    ingredient_abv,
+    load_recipe_batch,
+    method_dilution,
+    parse_ingredient,
+)
+
+RECIPES = Path(__file__).parent / "iba_cocktail_recipes.json"
+
+
+@pytest.fixture(scope="module")
+def metrics():
+    return {m["name"]: m for m in load_recipe_batch(RECIPES).metrics()}
+
+
+@pytest.mark.parametrize(
+    "name, abv",
+    [
+        ("Moscow Mule", 9.35),
+        ("Dark ‘N’ Stormy", 13.6),
+        ("Horse’s Neck", 9.3),
+        ("Spritz", 9.1),
+        ("Negroni", 24.55),
+        ("Daiquiri", 24.0),
+        ("Dry Martini", 30.7),
+    ],
+)
+def test_abv_estimates(metrics, name, abv):
+    assert metrics[name]["abv"] == pytest.approx(abv, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    "method, dilution",
+    [
+        ("Build all ingredients into a wine glass filled with ice. Stir gently.", 0.10),
+        ("Combine the vodka and ginger beer. Add lime juice and gently stir.", 0.10),
+        ("Pour all ingredients into mixing glass with ice cubes. Stir well.", 0.20),
+        ("Shake and strain into a chilled cocktail glass.", 0.25),
+        ("Serve with a milkshake straw.", 0.10),
+    ],
+)
+def test_method_dilution(method, dilution):
+    assert method_dilution(method) == dilution
+
+
+def test_ginger_is_not_gin():
+    assert ingredient_abv("ginger beer") == 0.0
+    assert ingredient_abv("ginger ale") == 0.0
+    assert ingredient_abv("gin") == 40.0
+    assert parse_ingredient("2-3 quarter size sliced fresh ginger")[1] == "pcs"
+
+
+def test_solids_and_counted_liquids():
+    assert parse_ingredient("4 Teaspoons White Cane Sugar") == (
+        4.0,
+        "tsp",
+        "white cane sugar",
+    )
+    assert parse_ingredient("1 strong Espresso") == (30.0, "ml", "strong espresso")
+
+
+def test_shopping_list_and_read_only_matrix():
+    batch = RecipeBatch(
+        [
+            {"name": "Negroni", "ingredients": ["30 ml Gin", "30 ml Campari"]},
+            {"name": "Gin Sour", "ingredients": ["60 ml Gin", "2 dashes Bitters"]},
+        ]
+    )
+    assert batch.shopping_list({"Negroni": 10, "Gin Sour": 5})[("gin", "ml")] == 600
+    with pytest.raises(ValueError):
+        batch.quantities[0, 0] = 0
+
+
+def test_shopping_list_skips_to_taste():
+    batch = RecipeBatch(
+        [{"name": "Bloody Mary", "ingredients": ["45 ml Vodka", "Tabasco, Pepper"]}]
+    )
+    assert batch.shopping_list(10) == {("vodka", "ml"): 450}
+
+
+def test_duplicate_names_rejected():
+    with pytest.raises(ValueError):
+        RecipeBatch([{"name": "Negroni"}, {"name": "Negroni"}])